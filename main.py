@@ -20,6 +20,7 @@ logger = setup_logger(
 
 @flow(name="Sora Union ETL")
 def sora_union_etl():
+    compact = config.get('compact_dtypes', False)
     
     # Create tables
     c_result = create_table_flow.submit()
@@ -29,18 +30,19 @@ def sora_union_etl():
     table_data_future = dimension_flow.submit(
         float_path=config['float_path'],
         clickup_path=config['clickup_path'],
-        check=c_result
+        check=c_result,
+        compact=compact
     )
     table_data = table_data_future.result()
 
-    fact_data_future = fact_flow.submit(table_data, wait_for=[table_data_future])
+    fact_data_future = fact_flow.submit(table_data, compact=compact, wait_for=[table_data_future])
     fact_data = fact_data_future.result()
     
     # Validate the schema
     validation_result = validate_schema(table_data=table_data, fact_table=fact_data)
     
     # Load data to BigQuery using the subflow
-    load_data_flow_future = load_data_flow.submit(table_data=table_data, fact_table=fact_data, wait_for=[table_data, fact_data_future,validation_result])
+    load_data_flow_future = load_data_flow.submit(table_data=table_data, fact_table=fact_data, compact=compact, wait_for=[table_data, fact_data_future,validation_result])
     load_data_flow_future.result()
     
     return True
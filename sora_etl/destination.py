@@ -1,4 +1,8 @@
+import io
 import logging
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from prefect import task, flow
 from prefect.futures import PrefectFuture
 import google.cloud.bigquery as bigquery
@@ -13,12 +17,46 @@ logger = setup_logger(
 )
 
 
+def dataframe_to_parquet(df: pd.DataFrame, schema: list) -> io.BytesIO:
+    """Writes the dataframe to an in-memory parquet file, keeping categorical columns dictionary-encoded."""
+    # Convert column by column so the frame itself is never copied
+    arrays, fields = [], []
+    for field in schema:
+        series = df[field.name]
+        if field.field_type == "DATE":
+            series = pd.to_datetime(series).dt.date
+
+        # Categoricals become arrow dictionary arrays, so the codes are written as-is
+        array = pa.Array.from_pandas(series)
+        if field.field_type == "FLOAT":
+            # Widen compact float32 columns so FLOAT64 receives the same values as the CSV load
+            array = array.cast(pa.float64())
+
+        arrays.append(array)
+        fields.append(pa.field(field.name, array.type, nullable=field.mode != "REQUIRED"))
+
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_arrays(arrays, schema=pa.schema(fields)), buffer, use_dictionary=True)
+    buffer.seek(0)
+    return buffer
+
+
 @task(task_run_name="{table_name}", log_prints=True, tags=["destination"] )
-def load_to_bq(table_name, df):
+def load_to_bq(table_name, df, compact: bool = False):
     
     try:
         table_id = f"{PROJECT_NAME}.{DATASET_NAME}.{table_name}"
         schema = bigquery_schema[table_name]
+        if compact:
+            job_config = bigquery.LoadJobConfig(
+                schema=schema,
+                autodetect=False,
+                source_format=bigquery.SourceFormat.PARQUET
+            )
+            parquet_file = dataframe_to_parquet(df, schema)
+            client.load_table_from_file(parquet_file, table_id, job_config=job_config).result()
+            return
+
         job_config = bigquery.LoadJobConfig(
         schema=schema,
         autodetect=False,
@@ -33,16 +71,16 @@ def load_to_bq(table_name, df):
 
 
 @task(task_run_name="Load Data To BQ")
-def load_data_flow(table_data: dict, fact_table: dict):
+def load_data_flow(table_data: dict, fact_table: dict, compact: bool = False):
 
     load_to_bq_future = []
     for table, df in table_data.items():
         if table in ["float", "clickup"]:
             continue
-        load_to_bq_future.append(load_to_bq.submit(table, df))
+        load_to_bq_future.append(load_to_bq.submit(table, df, compact))
 
     for table, df in fact_table.items():
-        load_to_bq_future.append(load_to_bq.submit(table, df))
+        load_to_bq_future.append(load_to_bq.submit(table, df, compact))
 
     for future in load_to_bq_future:
         future.result()
@@ -1,7 +1,9 @@
 
 import logging
+import numpy as np
 import pandas as pd
 import hashlib
+from pandas.api.types import union_categoricals
 from prefect import task, flow
 from prefect.futures import PrefectFuture
 from sora_etl.utils import table_name
@@ -22,9 +24,37 @@ def generate_deterministic_id(value: str) -> str:
     hash_object.update(value.encode('utf-8'))
     return hash_object.hexdigest()[:15]
 
-def load_datasets(float_path: str, clickup_path: str):
-    float_data = pd.read_csv(float_path)
-    clickup_data = pd.read_csv(clickup_path)
+def downcast_float(series: pd.Series) -> pd.Series:
+    """Downcasts a numeric column to float32 only when every value survives the round trip."""
+    values = series.astype("float64")
+    downcast = values.astype("float32")
+    if np.array_equal(values, downcast.astype("float64"), equal_nan=True):
+        return downcast
+    return values
+
+
+# Low-cardinality columns read as categoricals when running in compact mode
+category_columns = ["Client", "Project", "Name", "Role", "Task", "Billable"]
+merge_keys = ["Client", "Project", "Name"]
+
+
+def load_datasets(float_path: str, clickup_path: str, compact: bool = False):
+    if not compact:
+        float_data = pd.read_csv(float_path)
+        clickup_data = pd.read_csv(clickup_path)
+        return float_data, clickup_data
+
+    float_data = pd.read_csv(float_path, dtype={col: "category" for col in category_columns})
+    clickup_data = pd.read_csv(clickup_path, dtype={col: "category" for col in category_columns})
+
+    # Share categories on the merge keys so the fact merge can join on the codes
+    for col in merge_keys:
+        categories = union_categoricals([float_data[col], clickup_data[col]]).categories
+        float_data[col] = float_data[col].cat.set_categories(categories)
+        clickup_data[col] = clickup_data[col].cat.set_categories(categories)
+
+    float_data["Estimated Hours"] = downcast_float(float_data["Estimated Hours"])
+    clickup_data["Hours"] = downcast_float(clickup_data["Hours"])
     return float_data, clickup_data
 
 
@@ -35,7 +65,8 @@ def create_dimension(df: pd.DataFrame, column_name: str, id_column_name: str) ->
         if column_name == "Name":
             rename_column = "person_name"
 
-        dimension_df = df[column_name].drop_duplicates().reset_index().rename(columns={column_name: rename_column})
+        # Dimension rows are unique, so store them as plain strings even when the source column is categorical
+        dimension_df = df[column_name].drop_duplicates().astype(object).reset_index().rename(columns={column_name: rename_column})
         dimension_df[id_column_name] = dimension_df[rename_column].apply(generate_deterministic_id)
         dimension_df.drop(columns=["index"], inplace=True)
 
@@ -74,7 +105,7 @@ def create_time_dimension(start_date='2020-01-01', end_date='2030-12-31'):
 
 
 # @task(task_run_name="Fact", log_prints=True)
-def create_fact_table(table_data):
+def create_fact_table(table_data, compact: bool = False):
     try:
         float_data = table_data["float"]
         clickup_data = table_data["clickup"]
@@ -86,20 +117,29 @@ def create_fact_table(table_data):
         fact_df["task_id"] = fact_df["task_action"].map(table_data["dim_tasks"].set_index("task_name")["task_id"])
         fact_df["role_id"] = fact_df["Role"].map(table_data["dim_roles"].set_index("role_name")["role_id"])
         fact_df["person_id"] = fact_df["Name"].map(table_data["dim_persons"].set_index("person_name")["person_id"])
+        if compact:
+            for id_column in ["client_id", "project_id", "task_id", "role_id", "person_id"]:
+                fact_df[id_column] = fact_df[id_column].astype("category")
 
         
         fact_df["date"] = pd.to_datetime(fact_df["Date"]).dt.strftime('%Y-%m-%d')
-        fact_df["Estimated Hours"] = fact_df["Estimated Hours"].astype(float)
+        if not compact:
+            fact_df["Estimated Hours"] = fact_df["Estimated Hours"].astype(float)
 
         # Generate the work_tracking_id using deterministic IDs based on combined fields
-        fact_df["work_tracking_id"] = (fact_df["client_id"] + fact_df["project_id"] + 
-                                    fact_df["task_id"] + fact_df["role_id"] + 
-                                    fact_df["person_id"] + fact_df["date"])
+        # (ids may be categorical in compact mode, so concatenate them as plain strings)
+        fact_df["work_tracking_id"] = (fact_df["client_id"].astype(object) + fact_df["project_id"].astype(object) + 
+                                    fact_df["task_id"].astype(object) + fact_df["role_id"].astype(object) + 
+                                    fact_df["person_id"].astype(object) + fact_df["date"])
         fact_df["work_tracking_id"] = fact_df["work_tracking_id"].apply(generate_deterministic_id)
         # convert billable to boolean
-        fact_df["Billable"] = fact_df["Billable"].map({"Yes": True, "No": False})
+        fact_df["Billable"] = fact_df["Billable"].astype(object).map({"Yes": True, "No": False})
         fact_df["Start Date"] = pd.to_datetime(fact_df["Start Date"]).dt.strftime('%Y-%m-%d')
         fact_df["End Date"] = pd.to_datetime(fact_df["End Date"]).dt.strftime('%Y-%m-%d')
+        if compact:
+            # Dates repeat heavily across rows, so keep them dictionary-encoded as well
+            for date_column in ["date", "Start Date", "End Date"]:
+                fact_df[date_column] = fact_df[date_column].astype("category")
 
         fact_columns = [
             "work_tracking_id", "client_id", "project_id", "role_id", "person_id", 
@@ -122,8 +162,8 @@ def create_fact_table(table_data):
 
 
 @task(task_run_name="Prepare Dimension Data", tags=["dimension"])
-def dimension_flow(float_path: str, clickup_path: str, check: bool = False):
-    float_data, clickup_data = load_datasets(float_path, clickup_path)
+def dimension_flow(float_path: str, clickup_path: str, check: bool = False, compact: bool = False):
+    float_data, clickup_data = load_datasets(float_path, clickup_path, compact)
 
     client_df = create_dimension(float_data, "Client", "client_id")
     project_df = create_dimension(float_data, "Project", "project_id")
@@ -150,6 +190,6 @@ def dimension_flow(float_path: str, clickup_path: str, check: bool = False):
 
 
 @task(task_run_name="Prepare Fact Data")
-def fact_flow(table_data):
-    fact_df = create_fact_table(table_data)
+def fact_flow(table_data, compact: bool = False):
+    fact_df = create_fact_table(table_data, compact)
     return  {'fact_work_tracking': fact_df}
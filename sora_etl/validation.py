@@ -91,9 +91,12 @@ def table_schema(df: pd.DataFrame, expected_schema: dict) -> bool:
     for col, expected_dtype in expected_schema.items():
         actual_dtype = df[col].dtype
         
-        # Handle string columns (either StringDtype or object)
+        # Handle string columns (either StringDtype, object or categorical of strings)
         if expected_dtype == pd.StringDtype():
-            if not pd.api.types.is_string_dtype(df[col]):
+            if isinstance(actual_dtype, pd.CategoricalDtype):
+                if not pd.api.types.is_string_dtype(actual_dtype.categories):
+                    raise ValueError(f"Column '{col}' has incorrect type: expected string categories, but got {actual_dtype.categories.dtype}")
+            elif not pd.api.types.is_string_dtype(df[col]):
                 raise ValueError(f"Column '{col}' has incorrect type: expected string, but got {actual_dtype}")
         elif expected_dtype == 'int32' and actual_dtype == 'int64':
             continue
@@ -101,6 +104,8 @@ def table_schema(df: pd.DataFrame, expected_schema: dict) -> bool:
             continue
         elif expected_dtype == 'int64' and actual_dtype == 'int64':
             continue
+        elif expected_dtype == 'float64' and actual_dtype == 'float32':
+            continue
         elif actual_dtype != expected_dtype:
             raise ValueError(f"Column '{col}' has incorrect type: expected {expected_dtype}, but got {actual_dtype}")
     